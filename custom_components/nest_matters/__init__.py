@@ -13,7 +13,7 @@ from .const import PLATFORMS
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NestMattersData:
     """Runtime data for Nest Matters integration."""
 
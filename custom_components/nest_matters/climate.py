@@ -2,16 +2,18 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+import sys
+from typing import Any, Final
 
 from homeassistant.components.climate import (
     ClimateEntity,
     ClimateEntityFeature,
     HVACMode,
 )
-from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.const import ATTR_TEMPERATURE, STATE_UNAVAILABLE
+from homeassistant.core import Event, HassJobType, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import (
@@ -24,12 +26,27 @@ from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Push-based and coordinator-less: don't serialize service calls through the
+# platform semaphore. Forwarded calls are still subject to the source
+# entities' own platform limits.
+PARALLEL_UPDATES = 0
+
+# Debounce cooldown (seconds) for climate state writes
+_WRITE_COOLDOWN = 0.05
+
 _BASE_FEATURES = (
     ClimateEntityFeature.TARGET_TEMPERATURE
     | ClimateEntityFeature.TURN_ON
     | ClimateEntityFeature.TURN_OFF
 )
 
+# Source attributes read by _async_update_attrs(). Each source can act as the
+# fallback for the other, so both sets include the shared temperature keys.
+_MATTER_KEYS = frozenset(
+    {"current_temperature", "temperature", "min_temp", "max_temp", "hvac_modes"}
+)
+_GOOGLE_KEYS = _MATTER_KEYS | {"fan_mode", "fan_modes", "current_humidity"}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -46,6 +63,7 @@ async def async_setup_entry(
                 data.matter_entity,
                 data.google_entity,
                 config_entry.entry_id,
+                hass.config.units.temperature_unit,
             )
         ]
     )
@@ -65,8 +83,12 @@ class NestMattersClimate(ClimateEntity):
     _attr_should_poll = False
     _attr_has_entity_name = True
     _attr_name = None
-    _attr_temperature_unit = UnitOfTemperature.CELSIUS
-    _attr_supported_features = _BASE_FEATURES | ClimateEntityFeature.FAN_MODE
+
+    # Precomputed so the dynamic FAN_MODE toggle can compare by identity
+    _FEATURES_WITH_FAN: Final = _BASE_FEATURES | ClimateEntityFeature.FAN_MODE
+    _FEATURES_NO_FAN: Final = _BASE_FEATURES
+
+    _attr_supported_features = _FEATURES_WITH_FAN
 
     def __init__(
         self,
@@ -74,12 +96,20 @@ class NestMattersClimate(ClimateEntity):
         matter_entity_id: str,
         google_entity_id: str,
         entry_id: str,
+        temperature_unit: str,
     ) -> None:
         """Initialize the unified climate entity."""
         self._matter_entity_id = matter_entity_id
         self._google_entity_id = google_entity_id
 
-        self._attr_unique_id = f"{DOMAIN}_{entry_id}"
+        # Source entity state attributes contain temperatures already converted
+        # to the HA system unit. Declare the same unit to prevent
+        # double-conversion (e.g. treating 72°F as 72°C → 161.6°F). Set here
+        # because capability_attributes reads it before async_added_to_hass.
+        self._attr_temperature_unit = temperature_unit
+
+        # Interned: the unique id is used as a key throughout the registries
+        self._attr_unique_id = sys.intern(f"{DOMAIN}_{entry_id}")
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, entry_id)},
             name=name,
@@ -91,14 +121,16 @@ class NestMattersClimate(ClimateEntity):
         # These are populated from source entities in _async_update_attrs()
         # but must exist before the first state write during entity registration.
         self._attr_hvac_mode = None
-        self._attr_hvac_modes = []
+        self._attr_hvac_modes = ()
         self._attr_fan_mode = None
-        self._attr_fan_modes = []
+        self._attr_fan_modes = ()
         self._attr_target_temperature = None
         self._attr_min_temp = 7
         self._attr_max_temp = 35
         self._attr_current_humidity = None
         self._attr_available = False
+        self._matter_available = False
+        self._google_available = False
 
         # Source routing indicators (exposed via extra_state_attributes)
         self._temperature_source: str = "unavailable"
@@ -107,108 +139,226 @@ class NestMattersClimate(ClimateEntity):
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to source entity state changes."""
-        # Source entity state attributes contain temperatures already converted
-        # to the HA system unit. Declare the same unit to prevent
-        # double-conversion (e.g. treating 72°F as 72°C → 161.6°F).
-        self._attr_temperature_unit = self.hass.config.units.temperature_unit
+        # Matter and Google usually report the same user action within a few
+        # milliseconds of each other. Bursts are limited to one immediate write
+        # plus one trailing write per cooldown window.
+        self._write_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=_WRITE_COOLDOWN,
+            immediate=True,
+            function=self.async_write_ha_state,
+        )
+        self.async_on_remove(self._write_debouncer.async_cancel)
+
+        # Initial attribute population. Runs before subscribing; both happen
+        # synchronously in the event loop, so no state change can slip in
+        # between the snapshot and the subscription.
+        self._async_update_attrs()
 
         self.async_on_remove(
             async_track_state_change_event(
                 self.hass,
-                [self._matter_entity_id, self._google_entity_id],
+                (self._matter_entity_id, self._google_entity_id),
                 self._handle_source_state_change,
+                job_type=HassJobType.Callback,
             )
         )
 
-        # Initial attribute population
-        self._async_update_attrs()
-
     @callback
     def _handle_source_state_change(
         self, event: Event[EventStateChangedData]
     ) -> None:
         """Handle state changes from source entities."""
-        self.async_set_context(event.context)
-        self._async_update_attrs()
-        self.async_write_ha_state()
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        if (
+            old_state is not None
+            and new_state is not None
+            and old_state.state == new_state.state
+        ):
+            keys = (
+                _MATTER_KEYS
+                if event.data["entity_id"] == self._matter_entity_id
+                else _GOOGLE_KEYS
+            )
+            old_attrs = old_state.attributes
+            new_attrs = new_state.attributes
+            if all(old_attrs.get(key) == new_attrs.get(key) for key in keys):
+                return
+
+        # Both sources often report the same user action under one context;
+        # the most recent context is the one attributed to the debounced write.
+        if self._context is not event.context:
+            self.async_set_context(event.context)
+        if self._async_update_attrs(event.data["entity_id"], new_state):
+            self._write_debouncer.async_schedule_call()
 
+    @callback
     def _is_entity_available(self, entity_id: str) -> bool:
-        """Check if a source entity is available."""
-        state = self.hass.states.get(entity_id)
-        return state is not None and state.state != "unavailable"
+        """Check if a source entity is available, as of the last update."""
+        if entity_id == self._matter_entity_id:
+            return self._matter_available
+        return self._google_available
 
     @callback
-    def _async_update_attrs(self) -> None:
+    def _async_update_attrs(
+        self,
+        changed_id: str | None = None,
+        new_state: State | None = None,
+    ) -> bool:
         """Update all cached attributes from source entity states.
 
         Implements failover: prefers the primary source for each data category,
         falls back to the other source when the primary is unavailable.
+
+        When called from a state change event, ``new_state`` of ``changed_id``
+        is taken from the event so only the other source is looked up.
+
+        Returns True if any surfaced attribute changed, so callers can skip
+        redundant state writes.
         """
-        matter_state = self.hass.states.get(self._matter_entity_id)
-        google_state = self.hass.states.get(self._google_entity_id)
+        states = self.hass.states
+        if changed_id == self._matter_entity_id:
+            matter_state = new_state
+            google_state = states.get(self._google_entity_id)
+        elif changed_id == self._google_entity_id:
+            matter_state = states.get(self._matter_entity_id)
+            google_state = new_state
+        else:
+            matter_state = states.get(self._matter_entity_id)
+            google_state = states.get(self._google_entity_id)
 
         matter_available = (
-            matter_state is not None and matter_state.state != "unavailable"
+            matter_state is not None and matter_state.state != STATE_UNAVAILABLE
         )
         google_available = (
-            google_state is not None and google_state.state != "unavailable"
+            google_state is not None and google_state.state != STATE_UNAVAILABLE
         )
 
-        self._attr_available = matter_available or google_available
+        self._matter_available = matter_available
+        self._google_available = google_available
+        available = matter_available or google_available
+
+        # Attribute mappings of the available sources, bound once
+        matter_attrs = matter_state.attributes if matter_available else None
+        google_attrs = google_state.attributes if google_available else None
+
+        # Start from the cached values: a category without an available
+        # source keeps its last known values.
+        current_temperature = self._attr_current_temperature
+        target_temperature = self._attr_target_temperature
+        min_temp = self._attr_min_temp
+        max_temp = self._attr_max_temp
+        hvac_mode = self._attr_hvac_mode
+        hvac_modes = self._attr_hvac_modes
+        fan_mode = self._attr_fan_mode
+        fan_modes = self._attr_fan_modes
+        current_humidity = self._attr_current_humidity
 
         # --- Temperature: prefer Matter (local, fast), fall back to Google ---
-        if matter_available and matter_state.attributes:
-            matter_attrs = matter_state.attributes
-            self._attr_current_temperature = matter_attrs.get("current_temperature")
-            self._attr_target_temperature = matter_attrs.get("temperature")
-            self._attr_min_temp = matter_attrs.get("min_temp", 7)
-            self._attr_max_temp = matter_attrs.get("max_temp", 35)
-            self._temperature_source = "matter"
-        elif google_available and google_state.attributes:
-            google_attrs = google_state.attributes
-            self._attr_current_temperature = google_attrs.get("current_temperature")
-            self._attr_target_temperature = google_attrs.get("temperature")
-            self._attr_min_temp = google_attrs.get("min_temp", 7)
-            self._attr_max_temp = google_attrs.get("max_temp", 35)
-            self._temperature_source = "google (fallback)"
+        if matter_attrs is not None:
+            get = matter_attrs.get
+            current_temperature = get("current_temperature")
+            target_temperature = get("temperature")
+            min_temp = get("min_temp", 7)
+            max_temp = get("max_temp", 35)
+            temperature_source = "matter"
+        elif google_attrs is not None:
+            get = google_attrs.get
+            current_temperature = get("current_temperature")
+            target_temperature = get("temperature")
+            min_temp = get("min_temp", 7)
+            max_temp = get("max_temp", 35)
+            temperature_source = "google (fallback)"
         else:
-            self._temperature_source = "unavailable"
+            temperature_source = "unavailable"
 
         # --- HVAC mode: prefer Google (full features), fall back to Matter ---
         if google_available and google_state.state:
-            self._attr_hvac_mode = google_state.state
-            if google_state.attributes:
-                self._attr_hvac_modes = google_state.attributes.get(
-                    "hvac_modes", []
-                )
-            self._hvac_source = "google"
+            hvac_mode = google_state.state
+            hvac_modes = google_attrs.get("hvac_modes") or ()
+            hvac_source = "google"
         elif matter_available and matter_state.state:
-            self._attr_hvac_mode = matter_state.state
-            if matter_state.attributes:
-                self._attr_hvac_modes = matter_state.attributes.get(
-                    "hvac_modes", []
-                )
-            self._hvac_source = "matter (fallback)"
+            hvac_mode = matter_state.state
+            hvac_modes = matter_attrs.get("hvac_modes") or ()
+            hvac_source = "matter (fallback)"
         else:
-            self._hvac_source = "unavailable"
+            hvac_source = "unavailable"
 
         # --- Fan / humidity: Google only (no Matter equivalent) ---
-        if google_available and google_state.attributes:
-            google_attrs = google_state.attributes
-            self._attr_fan_mode = google_attrs.get("fan_mode")
-            self._attr_fan_modes = google_attrs.get("fan_modes", [])
-            self._attr_current_humidity = google_attrs.get("current_humidity")
-            self._fan_source = "google"
+        if google_attrs is not None:
+            get = google_attrs.get
+            fan_mode = get("fan_mode")
+            fan_modes = get("fan_modes") or ()
+            current_humidity = get("current_humidity")
+            fan_source = "google"
         else:
-            self._fan_source = "unavailable"
+            fan_source = "unavailable"
 
         # --- Dynamic features: toggle FAN_MODE based on Google availability ---
-        if google_available:
-            self._attr_supported_features = (
-                _BASE_FEATURES | ClimateEntityFeature.FAN_MODE
-            )
-        else:
-            self._attr_supported_features = _BASE_FEATURES
+        supported_features = (
+            self._FEATURES_WITH_FAN if google_available else self._FEATURES_NO_FAN
+        )
+        features_changed = self._attr_supported_features is not supported_features
+
+        # --- Change detection: skip the state write when nothing surfaced
+        # (including the source routing attributes) has changed ---
+        # Mode lists are cached as tuples; reuse the cached object when the
+        # contents are unchanged so it keeps its identity across writes.
+        hvac_modes = tuple(hvac_modes)
+        if hvac_modes == self._attr_hvac_modes:
+            hvac_modes = self._attr_hvac_modes
+        fan_modes = tuple(fan_modes)
+        if fan_modes == self._attr_fan_modes:
+            fan_modes = self._attr_fan_modes
+        if not features_changed and (
+            current_temperature,
+            target_temperature,
+            hvac_mode,
+            hvac_modes,
+            fan_mode,
+            fan_modes,
+            current_humidity,
+            min_temp,
+            max_temp,
+            available,
+            temperature_source,
+            hvac_source,
+            fan_source,
+        ) == (
+            self._attr_current_temperature,
+            self._attr_target_temperature,
+            self._attr_hvac_mode,
+            self._attr_hvac_modes,
+            self._attr_fan_mode,
+            self._attr_fan_modes,
+            self._attr_current_humidity,
+            self._attr_min_temp,
+            self._attr_max_temp,
+            self._attr_available,
+            self._temperature_source,
+            self._hvac_source,
+            self._fan_source,
+        ):
+            return False
+
+        self._attr_current_temperature = current_temperature
+        self._attr_target_temperature = target_temperature
+        self._attr_hvac_mode = hvac_mode
+        self._attr_hvac_modes = hvac_modes
+        self._attr_fan_mode = fan_mode
+        self._attr_fan_modes = fan_modes
+        self._attr_current_humidity = current_humidity
+        self._attr_min_temp = min_temp
+        self._attr_max_temp = max_temp
+        self._attr_available = available
+        if features_changed:
+            self._attr_supported_features = supported_features
+        self._temperature_source = temperature_source
+        self._hvac_source = hvac_source
+        self._fan_source = fan_source
+        return True
 
     @property
     def extra_state_attributes(self) -> dict[str, str]:
@@ -20,6 +20,8 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+
 
 class NestMattersConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Nest Matters."""
@@ -30,6 +32,11 @@ class NestMattersConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._discovered_pairs: list[dict[str, str]] = []
+        self._discovery_options: list[dict[str, str]] = []
+
+        # The climate entity scan is shared by the discovery and manual steps
+        # and only invalidated when a manual submission fails validation.
+        self._climate_entities_cache: list[str] | None = None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -65,24 +72,11 @@ class NestMattersConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 except (ValueError, IndexError):
                     errors["base"] = "invalid_selection"
 
-        # Show discovery options
-        discovery_options = []
-        for i, pair in enumerate(self._discovered_pairs):
-            discovery_options.append({
-                "value": str(i),
-                "label": f"{pair['name']} ({pair['matter']} + {pair['google']})"
-            })
-
-        # Add manual setup as an option in the main selector
-        discovery_options.append({
-            "value": "manual",
-            "label": "Configure Manually Instead"
-        })
-
+        # Show discovery options (built alongside the discovered pairs)
         schema = vol.Schema({
             vol.Required("selected_option"): selector.SelectSelector(
                 selector.SelectSelectorConfig(
-                    options=discovery_options
+                    options=self._discovery_options
                 )
             ),
         })
@@ -106,7 +100,10 @@ class NestMattersConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # Validate the input
             errors = await self._validate_input(user_input)
 
-            if not errors:
+            if errors:
+                # Entities may have changed since the form was rendered
+                self._climate_entities_cache = None
+            else:
                 # Check if already configured
                 unique_id = f"{user_input[CONF_MATTER_ENTITY]}_{user_input[CONF_GOOGLE_ENTITY]}"
                 await self.async_set_unique_id(unique_id)
@@ -148,6 +145,12 @@ class NestMattersConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def _discover_thermostat_pairs(self) -> list[dict[str, str]]:
         """Discover potential thermostat pairs automatically."""
         climate_entities = await self._get_climate_entities()
+        climate_set = set(climate_entities)
+        configured_ids = {
+            entry.unique_id
+            for entry in self._async_current_entries()
+            if entry.unique_id
+        }
 
         # Look for patterns: *_matter and corresponding base entity
         matter_entities = [e for e in climate_entities if "_matter" in e]
@@ -156,12 +159,16 @@ class NestMattersConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         for matter_entity in matter_entities:
             # Try to find corresponding Google entity
             base_name = matter_entity.replace("_matter", "")
-            if base_name in climate_entities:
+            if base_name in climate_set:
                 # Check if this pair is already configured
                 unique_id = f"{matter_entity}_{base_name}"
-                if not self._is_already_configured(unique_id):
+                if unique_id not in configured_ids:
                     # Extract room name for display
-                    room_name = base_name.replace("climate.", "").replace("_", " ").title()
+                    room_name = (
+                        base_name.removeprefix("climate.")
+                        .translate(_UNDERSCORE_TO_SPACE)
+                        .title()
+                    )
                     pairs.append({
                         "name": room_name,
                         "matter": matter_entity,
@@ -169,28 +176,40 @@ class NestMattersConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     })
 
         _LOGGER.debug("Discovered %d available thermostat pairs: %s", len(pairs), pairs)
+        self._discovery_options = [
+            {
+                "value": str(i),
+                "label": f"{pair['name']} ({pair['matter']} + {pair['google']})"
+            }
+            for i, pair in enumerate(pairs)
+        ]
+        # Add manual setup as an option in the main selector
+        self._discovery_options.append({
+            "value": "manual",
+            "label": "Configure Manually Instead"
+        })
         return pairs
 
-    def _is_already_configured(self, unique_id: str) -> bool:
-        """Check if a unique_id is already configured."""
-        existing_entries = self._async_current_entries()
-        return any(entry.unique_id == unique_id for entry in existing_entries)
-
     async def _get_climate_entities(self) -> list[str]:
         """Get all available climate entities."""
+        if self._climate_entities_cache is not None:
+            return self._climate_entities_cache
+
         entity_registry = er.async_get(self.hass)
-        climate_entities = []
 
-        for entity in entity_registry.entities.values():
-            if entity.domain == "climate":
-                climate_entities.append(entity.entity_id)
+        # Full scan of the registry, filtered on the climate. prefix of each
+        # entity_id (the registry has no domain index)
+        climate_entities = {
+            entity_id
+            for entity_id in entity_registry.entities
+            if entity_id.startswith("climate.")
+        }
 
         # Also add entities from current states (for entities not in registry)
-        for entity_id in self.hass.states.async_entity_ids("climate"):
-            if entity_id not in climate_entities:
-                climate_entities.append(entity_id)
+        climate_entities.update(self.hass.states.async_entity_ids("climate"))
 
-        return sorted(climate_entities)
+        self._climate_entities_cache = sorted(climate_entities)
+        return self._climate_entities_cache
 
     async def _validate_input(self, user_input: dict[str, Any]) -> dict[str, str]:
         """Validate user input."""
@@ -209,15 +228,15 @@ class NestMattersConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             (matter_entity, CONF_MATTER_ENTITY),
             (google_entity, CONF_GOOGLE_ENTITY),
         ]:
+            if not entity_id.startswith("climate."):
+                errors[conf_key] = "entity_not_climate"
+                continue
+
             state = self.hass.states.get(entity_id)
             if not state:
                 errors[conf_key] = "invalid_entity"
                 continue
 
-            if state.domain != "climate":
-                errors[conf_key] = "entity_not_climate"
-                continue
-
             if state.state == "unavailable":
                 errors[conf_key] = "entity_unavailable"
 
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from homeassistant.components.sensor import SensorEntity
-from homeassistant.const import EntityCategory
+from homeassistant.const import STATE_UNAVAILABLE, EntityCategory
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -15,11 +15,11 @@ from . import NestMattersConfigEntry
 from .const import DOMAIN
 
 # (key, display name, primary source, fallback source or None)
-_SOURCE_SENSORS: list[tuple[str, str, str, str | None]] = [
+_SOURCE_SENSORS: tuple[tuple[str, str, str, str | None], ...] = (
     ("temperature_source", "Temperature Source", "matter", "google"),
     ("hvac_source", "HVAC Source", "google", "matter"),
     ("fan_source", "Fan Source", "google", None),
-]
+)
 
 
 async def async_setup_entry(
@@ -66,10 +66,27 @@ class NestMattersSourceSensor(SensorEntity):
         fallback: str | None,
     ) -> None:
         """Initialize the diagnostic sensor."""
-        self._matter_entity_id = matter_entity_id
-        self._google_entity_id = google_entity_id
         self._primary = primary
-        self._fallback = fallback
+
+        # Sources are fixed per sensor, so resolve them to entity ids once
+        source_to_entity = {
+            "matter": matter_entity_id,
+            "google": google_entity_id,
+        }
+        self._primary_entity_id = source_to_entity[primary]
+        self._fallback_entity_id: str | None = (
+            source_to_entity[fallback] if fallback else None
+        )
+        self._fallback_label: str | None = (
+            f"{fallback} (fallback)" if fallback else None
+        )
+
+        # Only subscribe to the sources this sensor reads
+        self._tracked_entities: tuple[str, ...] = (
+            (self._primary_entity_id,)
+            if self._fallback_entity_id is None
+            else (self._primary_entity_id, self._fallback_entity_id)
+        )
 
         self._attr_unique_id = f"{DOMAIN}_{entry_id}_{sensor_key}"
         self._attr_name = sensor_name
@@ -83,7 +100,7 @@ class NestMattersSourceSensor(SensorEntity):
         self.async_on_remove(
             async_track_state_change_event(
                 self.hass,
-                [self._matter_entity_id, self._google_entity_id],
+                self._tracked_entities,
                 self._handle_source_state_change,
             )
         )
@@ -94,24 +111,26 @@ class NestMattersSourceSensor(SensorEntity):
         self, event: Event[EventStateChangedData]
     ) -> None:
         """Handle state changes from source entities."""
+        old_value = self._attr_native_value
         self._async_update_value()
-        self.async_write_ha_state()
-
-    def _is_source_available(self, source: str) -> bool:
-        """Check if a named source (matter/google) is available."""
-        entity_id = (
-            self._matter_entity_id if source == "matter"
-            else self._google_entity_id
-        )
-        state = self.hass.states.get(entity_id)
-        return state is not None and state.state != "unavailable"
+        # Most source updates are readings that leave the active source as is
+        if self._attr_native_value != old_value:
+            self.async_write_ha_state()
 
     @callback
     def _async_update_value(self) -> None:
         """Compute which source is active."""
-        if self._is_source_available(self._primary):
+        states = self.hass.states
+
+        state = states.get(self._primary_entity_id)
+        if state is not None and state.state != STATE_UNAVAILABLE:
             self._attr_native_value = self._primary
-        elif self._fallback and self._is_source_available(self._fallback):
-            self._attr_native_value = f"{self._fallback} (fallback)"
-        else:
-            self._attr_native_value = "unavailable"
+            return
+
+        if self._fallback_entity_id is not None:
+            state = states.get(self._fallback_entity_id)
+            if state is not None and state.state != STATE_UNAVAILABLE:
+                self._attr_native_value = self._fallback_label
+                return
+
+        self._attr_native_value = "unavailable"